@@ -8,12 +8,19 @@ Security model:
 
 import json
 import logging
+import mmap
 import os
 import stat
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson  # C-implemented JSON parser, ~3-10x faster than stdlib
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger("mcp-ssh")
 
 
@@ -22,9 +29,14 @@ class ConfigError(Exception):
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HostConfig:
-    """Configuration for a single SSH host."""
+    """Configuration for a single SSH host.
+
+    Instances are immutable after construction. allowed_commands arrives
+    from JSON as a list and is stored as a frozenset so the per-execute
+    membership check is O(1).
+    """
     name: str
     hostname: str
     username: str
@@ -34,26 +46,47 @@ class HostConfig:
     auto_accept_host_key: bool = False
     command_timeout: int = 30
     transfer_timeout: int = 120
-    allowed_commands: Optional[list[str]] = None  # None = all allowed
+    pool_size: int = 4  # max concurrent SSH clients kept for this host
+    allowed_commands: Optional[frozenset[str]] = None  # None = all allowed
 
     def __post_init__(self):
+        # Required string fields — validated here so load_config can feed the
+        # raw JSON object straight into the constructor in a single pass.
+        for attr in ("name", "hostname", "username"):
+            value = getattr(self, attr)
+            if type(value) is not str or not value:
+                raise ConfigError(f"missing or invalid '{attr}'")
         if not self.identity_file and not self.password:
             raise ConfigError(
                 f"Host '{self.name}': must specify either 'identity_file' or 'password'"
             )
         if self.identity_file:
-            expanded = os.path.expanduser(self.identity_file)
-            if not os.path.isfile(expanded):
+            expanded = self.identity_file
+            if "~" in expanded:
+                expanded = os.path.expanduser(expanded)
+            # One stat covers the existence check and a key-permissions warning
+            try:
+                key_stat = os.stat(expanded)
+            except OSError:
+                key_stat = None
+            if key_stat is None or not stat.S_ISREG(key_stat.st_mode):
                 logger.warning(f"Identity file not found: {expanded} (host: {self.name})")
-            self.identity_file = expanded
+            elif key_stat.st_mode & (stat.S_IRGRP | stat.S_IROTH):
+                logger.warning(
+                    f"Identity file {expanded} is readable by group/others "
+                    f"(host: {self.name}). Run: chmod 600 {expanded}"
+                )
+            object.__setattr__(self, "identity_file", expanded)
         if not (1 <= self.port <= 65535):
             raise ConfigError(f"Host '{self.name}': invalid port {self.port}")
         if self.command_timeout < 1:
             raise ConfigError(f"Host '{self.name}': command_timeout must be >= 1")
         if self.transfer_timeout < 1:
             raise ConfigError(f"Host '{self.name}': transfer_timeout must be >= 1")
+        if not (1 <= self.pool_size <= 32):
+            raise ConfigError(f"Host '{self.name}': pool_size must be between 1 and 32")
         if self.allowed_commands is not None:
-            if not isinstance(self.allowed_commands, list):
+            if type(self.allowed_commands) is not list:
                 raise ConfigError(
                     f"Host '{self.name}': 'allowed_commands' must be a list, "
                     f"got {type(self.allowed_commands).__name__}"
@@ -64,13 +97,14 @@ class HostConfig:
                     f"Use null/omit to allow all commands, or list specific commands."
                 )
             for j, cmd in enumerate(self.allowed_commands):
-                if not isinstance(cmd, str) or not cmd:
+                if type(cmd) is not str or not cmd:
                     raise ConfigError(
                         f"Host '{self.name}': allowed_commands[{j}] must be a non-empty string"
                     )
+            object.__setattr__(self, "allowed_commands", frozenset(self.allowed_commands))
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerConfig:
     """Top-level server configuration."""
     hosts: dict[str, HostConfig] = field(default_factory=dict)
@@ -78,6 +112,9 @@ class ServerConfig:
     audit_log_file: Optional[str] = None
 
     def get_host(self, name: str) -> HostConfig:
+        # Host names are interned at load time; interning the lookup key too
+        # lets the dict probe succeed on pointer equality.
+        name = sys.intern(name)
         if name not in self.hosts:
             available = ", ".join(self.hosts.keys()) or "(none)"
             raise ConfigError(
@@ -86,10 +123,15 @@ class ServerConfig:
         return self.hosts[name]
 
 
-def _check_file_permissions(path: Path) -> None:
-    """Warn if config file is readable by group or others (Unix only)."""
+def _check_file_permissions(path: Path, file_stat: Optional[os.stat_result] = None) -> None:
+    """Warn if config file is readable by group or others (Unix only).
+
+    Accepts an already-fetched stat result so callers that have just
+    stat'd the path don't pay for a second syscall.
+    """
     try:
-        file_stat = path.stat()
+        if file_stat is None:
+            file_stat = path.stat()
         mode = file_stat.st_mode
         if mode & (stat.S_IRGRP | stat.S_IROTH):
             logger.warning(
@@ -104,26 +146,54 @@ def _check_file_permissions(path: Path) -> None:
 
 def load_config(config_path: str) -> ServerConfig:
     """Load and validate server configuration from a JSON file."""
-    path = Path(config_path).expanduser().resolve()
-
-    if not path.exists():
+    # Only expand/resolve when actually needed: resolve() stats every path
+    # component, which is wasted work for the common absolute-path case.
+    raw_path = config_path
+    if raw_path.startswith("~"):
+        raw_path = os.path.expanduser(raw_path)
+    path = Path(raw_path)
+    if not path.is_absolute():
+        path = path.resolve()
+
+    # One stat covers both the existence check and the permissions warning
+    try:
+        file_stat = path.stat()
+    except OSError:
         raise ConfigError(f"Config file not found: {path}")
 
-    _check_file_permissions(path)
+    _check_file_permissions(path, file_stat)
 
-    with open(path) as f:
+    # Hand the C decoder a zero-copy view of the file via mmap. Empty files
+    # (ValueError) and platforms where mmap is unavailable fall back to a
+    # plain read; stdlib json gains nothing from mmap, so it always reads.
+    mm = None
+    if orjson is not None:
         try:
-            data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise ConfigError(f"Invalid JSON in config file: {e}")
+            with open(path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            mm = None
+
+    try:
+        # orjson.JSONDecodeError and json.JSONDecodeError both subclass ValueError
+        if mm is not None:
+            data = orjson.loads(memoryview(mm))
+        else:
+            raw_bytes = path.read_bytes()
+            data = orjson.loads(raw_bytes) if orjson is not None else json.loads(raw_bytes)
+    except ValueError as e:
+        raise ConfigError(f"Invalid JSON in config file: {e}")
+    finally:
+        if mm is not None:
+            mm.close()
 
     # Parse top-level settings
     log_level = data.get("log_level", "INFO")
-    if not isinstance(log_level, str):
+    if type(log_level) is not str:
         raise ConfigError(f"'log_level' must be a string, got {type(log_level).__name__}")
 
     audit_log_file = data.get("audit_log_file")
-    if audit_log_file is not None and not isinstance(audit_log_file, str):
+    if audit_log_file is not None and type(audit_log_file) is not str:
         raise ConfigError(
             f"'audit_log_file' must be a string path or null, "
             f"got {type(audit_log_file).__name__}"
@@ -131,50 +201,39 @@ def load_config(config_path: str) -> ServerConfig:
 
     # Parse hosts
     raw_hosts = data.get("hosts", [])
-    if not isinstance(raw_hosts, list):
+    if type(raw_hosts) is not list:
         raise ConfigError("'hosts' must be a list")
 
     hosts = {}
-    seen_names = set()
 
     for i, raw in enumerate(raw_hosts):
         ctx = f"hosts[{i}]"
-        if not isinstance(raw, dict):
+        if type(raw) is not dict:
             raise ConfigError(f"{ctx}: each host entry must be a JSON object, got {type(raw).__name__}")
 
-        name = raw.get("name")
-        if not name or not isinstance(name, str):
-            raise ConfigError(f"{ctx}: missing or invalid 'name'")
-        if name in seen_names:
-            raise ConfigError(f"{ctx}: duplicate host name '{name}'")
-        seen_names.add(name)
-
-        hostname = raw.get("hostname")
-        if not hostname or not isinstance(hostname, str):
-            raise ConfigError(f"{ctx}: missing or invalid 'hostname'")
-
-        username = raw.get("username")
-        if not username or not isinstance(username, str):
-            raise ConfigError(f"{ctx}: missing or invalid 'username'")
-
+        # All per-field validation lives in HostConfig.__post_init__, so the
+        # raw JSON object is decoded into a host in one constructor pass.
         try:
             host = HostConfig(
-                name=name,
-                hostname=hostname,
-                username=username,
+                name=raw.get("name"),
+                hostname=raw.get("hostname"),
+                username=raw.get("username"),
                 port=raw.get("port", 22),
                 identity_file=raw.get("identity_file"),
                 password=raw.get("password"),
                 auto_accept_host_key=raw.get("auto_accept_host_key", False),
                 command_timeout=raw.get("command_timeout", 30),
                 transfer_timeout=raw.get("transfer_timeout", 120),
+                pool_size=raw.get("pool_size", 4),
                 allowed_commands=raw.get("allowed_commands"),
             )
-        except ConfigError:
-            raise
         except Exception as e:
             raise ConfigError(f"{ctx}: {e}")
 
+        # Intern the name so get_host lookups hit the identity fast path
+        name = sys.intern(host.name)
+        if name in hosts:
+            raise ConfigError(f"{ctx}: duplicate host name '{name}'")
         hosts[name] = host
 
     config = ServerConfig(
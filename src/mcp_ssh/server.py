@@ -9,65 +9,143 @@ import atexit
 import json
 import logging
 import os
+import queue
+import re
+import stat
 import sys
 import threading
-from datetime import datetime, timezone
-from typing import Optional
-
-from fastmcp import FastMCP
+import time
+import uuid
+from typing import TYPE_CHECKING, Optional
 
 from .config import ConfigError, load_config
-from .ssh_client import SSHManager
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
+
+    from .ssh_client import SSHManager
+
+try:
+    import orjson  # C-implemented JSON encoder — audit entries are written per tool call
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger("mcp-ssh")
 
+
+def _json_str(s: str) -> str:
+    """Encode a Python string as a JSON string literal, quotes included."""
+    if orjson is not None:
+        return orjson.dumps(s).decode()
+    return json.dumps(s)
+
 # ---------------------------------------------------------------------------
 # Globals set during startup
 # ---------------------------------------------------------------------------
-_manager: Optional[SSHManager] = None
+_manager: Optional["SSHManager"] = None
 _audit_file: Optional[str] = None
-_audit_lock = threading.Lock()
+_audit_fd: Optional[int] = None
+_audit_queue: Optional[queue.SimpleQueue] = None
+
+# Sentinel that tells the audit writer thread to flush and exit
+_AUDIT_SHUTDOWN = object()
 
+# How long the writer lingers after the first entry so a burst of tool
+# calls (e.g. ssh_execute_batch) lands in a single write
+_AUDIT_LINGER_S = 0.05
 
-def _get_manager() -> SSHManager:
+
+def _get_manager() -> "SSHManager":
     """Get the initialized manager or raise a clear error."""
     if _manager is None:
         raise RuntimeError("SSH server not initialized — call run() first")
     return _manager
 
 
+# (second, "YYYY-MM-DDTHH:MM:SS") cache for _utc_timestamp. Stored as one
+# tuple so concurrent readers always see a consistent pair; a rare
+# duplicate regeneration under races is harmless.
+_TS_CACHE: tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """ISO-8601 UTC timestamp (microsecond precision, +00:00 offset).
+
+    Formatting a datetime per call is measurably slower than this:
+    the date/time prefix only changes once per second, so it is cached
+    and only the fractional part is formatted per call.
+    """
+    global _TS_CACHE
+    ns = time.time_ns()
+    sec = ns // 1_000_000_000
+    cached_sec, prefix = _TS_CACHE
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _TS_CACHE = (sec, prefix)
+    return f"{prefix}.{ns % 1_000_000_000 // 1000:06d}+00:00"
+
+
 def _audit(action: str, host: str, detail: str = "") -> None:
-    """Write a structured audit log entry (thread-safe)."""
-    entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "action": action,
-        "host": host,
-        "detail": detail[:500],
-    }
-    logger.info(f"AUDIT: {json.dumps(entry)}")
-    if _audit_file:
-        with _audit_lock:
+    """Record a structured audit log entry (thread-safe).
+
+    Entries are serialized once here, then handed to a background writer
+    thread so the tool call never blocks on audit-file I/O.
+
+    The line is built directly — no intermediate dict per call. timestamp
+    and action are generated internally and never need escaping; host and
+    detail are caller-supplied and go through the JSON string encoder.
+    """
+    line = (
+        f'{{"timestamp":"{_utc_timestamp()}","action":"{action}",'
+        f'"host":{_json_str(host)},"detail":{_json_str(detail[:500])}}}'
+    )
+    logger.info(f"AUDIT: {line}")
+    if _audit_queue is not None:
+        _audit_queue.put(line + "\n")
+
+
+def _audit_writer() -> None:
+    """Drain queued audit lines and write them to the audit file in batches."""
+    while True:
+        item = _audit_queue.get()
+        if item is _AUDIT_SHUTDOWN:
+            return
+        batch = [item]
+        # Linger briefly so back-to-back entries coalesce into one write
+        deadline = time.monotonic() + _AUDIT_LINGER_S
+        shutdown = False
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
             try:
-                with open(_audit_file, "a") as f:
-                    f.write(json.dumps(entry) + "\n")
-            except Exception as e:
-                logger.warning(f"Failed to write audit log: {e}")
+                item = _audit_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _AUDIT_SHUTDOWN:
+                shutdown = True
+                break
+            batch.append(item)
+        try:
+            # One os.write per batch; O_APPEND makes the append atomic even
+            # if something else has the audit file open
+            os.write(_audit_fd, "".join(batch).encode())
+        except Exception as e:
+            logger.warning(f"Failed to write audit log: {e}")
+        if shutdown:
+            return
 
 
 # ---------------------------------------------------------------------------
-# MCP Server and Tools
+# MCP Tools
+#
+# Tool functions are plain module-level callables; _build_mcp() registers
+# them on a FastMCP instance at startup. This keeps fastmcp (and, via the
+# SSH manager, paramiko/cryptography) out of module import so that e.g.
+# `python -m mcp_ssh --help` doesn't pay for loading them.
 # ---------------------------------------------------------------------------
-mcp = FastMCP(
-    name="mcp-ssh",
-    instructions=(
-        "SSH server for remote command execution and file transfer. "
-        "Use list_hosts to see available hosts before connecting. "
-        "All hosts must be pre-configured in the hosts.json config file."
-    ),
-)
 
 
-@mcp.tool
 def list_hosts() -> list[dict]:
     """List all configured SSH hosts and their connection status.
 
@@ -78,7 +156,6 @@ def list_hosts() -> list[dict]:
     return _get_manager().list_hosts()
 
 
-@mcp.tool
 def ssh_execute(host: str, command: str) -> dict:
     """Execute a shell command on a remote SSH host.
 
@@ -101,7 +178,64 @@ def ssh_execute(host: str, command: str) -> dict:
     }
 
 
-@mcp.tool
+def _batch_sentinel() -> str:
+    """Random per-invocation marker for splitting batched command output.
+
+    The marker carries each command's exit code and must never appear in
+    real output; a fixed literal would let any command that echoes it
+    (deliberately or via set -x tracing) shift the split and forge exit
+    codes, so a fresh random token is drawn per batch.
+    """
+    return f"__MCP_RC_{uuid.uuid4().hex}"
+
+
+def _build_batch_script(commands: list[str], stop_on_error: bool, sentinel: str) -> str:
+    """Join a command batch into a single remote shell script.
+
+    After each command the sentinel (with the command's exit code) is
+    printed to both stdout and stderr so both streams can be split back
+    into per-command chunks. With stop_on_error the script exits after
+    the first failing command, matching the per-command loop semantics.
+    """
+    parts = []
+    for cmd in commands:
+        parts.append(cmd)
+        parts.append(
+            '__mcp_rc=$?; '
+            f'printf "{sentinel}_%s__\\n" "$__mcp_rc"; '
+            f'printf "{sentinel}_%s__\\n" "$__mcp_rc" >&2'
+        )
+        if stop_on_error:
+            parts.append('if [ "$__mcp_rc" -ne 0 ]; then exit "$__mcp_rc"; fi')
+    return "\n".join(parts)
+
+
+def _split_batch_output(
+    stdout: str, stderr: str, commands: list[str], sentinel: str
+) -> list[dict]:
+    """Split sentinel-delimited batch output into per-command results.
+
+    Commands that never ran (stop_on_error exit) have no sentinel and
+    produce no result entry, matching the per-command loop's early break.
+    """
+    rc_re = re.compile(re.escape(sentinel) + r"_(\d+)__\n?")
+    out_chunks = rc_re.split(stdout)
+    err_chunks = rc_re.split(stderr)
+    results = []
+    for idx, cmd in enumerate(commands):
+        rc_pos = 2 * idx + 1
+        if rc_pos >= len(out_chunks):
+            break
+        results.append({
+            "command": cmd,
+            "exit_code": int(out_chunks[rc_pos]),
+            "stdout": out_chunks[2 * idx],
+            "stderr": err_chunks[2 * idx] if 2 * idx < len(err_chunks) else "",
+            "duration_ms": None,
+        })
+    return results
+
+
 def ssh_execute_batch(host: str, commands: list[str], stop_on_error: bool = True) -> dict:
     """Execute multiple commands sequentially on a remote SSH host.
 
@@ -112,13 +246,43 @@ def ssh_execute_batch(host: str, commands: list[str], stop_on_error: bool = True
             command that fails (non-zero exit code or exception).
 
     Returns:
-        Dict with results list and overall success boolean.
+        Dict with results list and overall success boolean. For hosts
+        without an allowed_commands list the whole batch runs as one
+        remote shell script (one SSH round-trip); in that mode only the
+        batch-level duration_ms is reported and per-command duration_ms
+        is null.
     """
     _audit("execute_batch", host, f"{len(commands)} commands")
     conn = _get_manager().get_connection(host)
     results = []
     success = True
 
+    # Allowlist hosts reject composite commands (shell metacharacters), so
+    # only they take the one-channel-per-command path.
+    if conn.config.allowed_commands is None and len(commands) > 1:
+        sentinel = _batch_sentinel()
+        script = _build_batch_script(commands, stop_on_error, sentinel)
+        try:
+            result = conn.execute(script)
+        except Exception as e:
+            logger.error(f"Batch execution failed on {host}: {e}")
+            return {
+                "results": [],
+                "success": False,
+                "error": f"Batch execution failed on '{host}'",
+            }
+        results = _split_batch_output(result.stdout, result.stderr, commands, sentinel)
+        # Audit only the commands the script actually ran — with
+        # stop_on_error the tail after a failure never executes and must
+        # not appear in the trail
+        for r in results:
+            _audit("execute", host, r["command"])
+        success = (
+            len(results) == len(commands)
+            and all(r["exit_code"] == 0 for r in results)
+        )
+        return {"results": results, "success": success, "duration_ms": result.duration_ms}
+
     for cmd in commands:
         _audit("execute", host, cmd)
         try:
@@ -150,7 +314,6 @@ def ssh_execute_batch(host: str, commands: list[str], stop_on_error: bool = True
     return {"results": results, "success": success}
 
 
-@mcp.tool
 def ssh_upload(host: str, local_path: str, remote_path: str) -> dict:
     """Upload a local file to a remote SSH host via SFTP.
 
@@ -167,7 +330,6 @@ def ssh_upload(host: str, local_path: str, remote_path: str) -> dict:
     return conn.upload(local_path, remote_path)
 
 
-@mcp.tool
 def ssh_download(host: str, remote_path: str, local_path: str) -> dict:
     """Download a file from a remote SSH host via SFTP.
 
@@ -184,7 +346,6 @@ def ssh_download(host: str, remote_path: str, local_path: str) -> dict:
     return conn.download(remote_path, local_path)
 
 
-@mcp.tool
 def ssh_status(host: str) -> dict:
     """Check connectivity and status for a specific SSH host.
 
@@ -219,7 +380,6 @@ def ssh_status(host: str) -> dict:
     return status
 
 
-@mcp.tool
 def ssh_disconnect(host: str) -> dict:
     """Disconnect from a specific SSH host.
 
@@ -235,11 +395,37 @@ def ssh_disconnect(host: str) -> dict:
     return {"host": host, "state": "disconnected"}
 
 
+def _build_mcp() -> "FastMCP":
+    """Create the FastMCP server and register all SSH tools on it."""
+    from fastmcp import FastMCP
+
+    mcp = FastMCP(
+        name="mcp-ssh",
+        instructions=(
+            "SSH server for remote command execution and file transfer. "
+            "Use list_hosts to see available hosts before connecting. "
+            "All hosts must be pre-configured in the hosts.json config file."
+        ),
+    )
+    for tool_fn in (
+        list_hosts,
+        ssh_execute,
+        ssh_execute_batch,
+        ssh_upload,
+        ssh_download,
+        ssh_status,
+        ssh_disconnect,
+    ):
+        mcp.tool(tool_fn)
+    return mcp
+
+
 # ---------------------------------------------------------------------------
 # Server Lifecycle
 # ---------------------------------------------------------------------------
 
-_VALID_LOG_LEVELS = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_VALID_LOG_LEVELS_DISPLAY = ", ".join(sorted(_VALID_LOG_LEVELS))
 
 
 def _find_config() -> str:
@@ -249,7 +435,12 @@ def _find_config() -> str:
         os.path.expanduser("~/.ssh/mcp-hosts.json"),
     ]
     for path in candidates:
-        if os.path.isfile(path):
+        # Single stat per candidate instead of isfile's stat-plus-wrapper
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
             return path
     searched = "\n  ".join(candidates)
     raise ConfigError(
@@ -260,7 +451,10 @@ def _find_config() -> str:
 
 def run(config_path: Optional[str] = None) -> None:
     """Initialize and run the MCP SSH server."""
-    global _manager, _audit_file
+    global _manager, _audit_file, _audit_fd, _audit_queue
+
+    # Import here (not at module load) — pulls in paramiko/cryptography
+    from .ssh_client import SSHManager
 
     # Find config
     if not config_path:
@@ -274,7 +468,7 @@ def run(config_path: Optional[str] = None) -> None:
     if log_level not in _VALID_LOG_LEVELS:
         raise ConfigError(
             f"Invalid log_level '{config.log_level}'. "
-            f"Must be one of: {', '.join(sorted(_VALID_LOG_LEVELS))}"
+            f"Must be one of: {_VALID_LOG_LEVELS_DISPLAY}"
         )
 
     logging.basicConfig(
@@ -284,6 +478,23 @@ def run(config_path: Optional[str] = None) -> None:
     )
 
     _audit_file = config.audit_log_file
+    if _audit_file:
+        # One long-lived O_APPEND descriptor for the server lifetime; the
+        # writer thread appends each batch with a single os.write. Created
+        # 0o600 since audit entries can contain command lines.
+        try:
+            _audit_fd = os.open(
+                _audit_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600
+            )
+        except OSError as e:
+            raise ConfigError(f"Cannot open audit log file '{_audit_file}': {e}")
+        _audit_queue = queue.SimpleQueue()
+        audit_thread = threading.Thread(
+            target=_audit_writer, name="audit-writer", daemon=True
+        )
+        audit_thread.start()
+    else:
+        audit_thread = None
     _manager = SSHManager(config)
 
     logger.info(f"MCP SSH Server starting with {len(config.hosts)} host(s)")
@@ -293,8 +504,16 @@ def run(config_path: Optional[str] = None) -> None:
         logger.info("Shutting down — closing all connections...")
         if _manager:
             _manager.disconnect_all()
+        if audit_thread is not None:
+            # Flush any queued audit entries before the process exits
+            _audit_queue.put(_AUDIT_SHUTDOWN)
+            audit_thread.join(timeout=2)
+            try:
+                os.close(_audit_fd)
+            except OSError:
+                pass
 
     atexit.register(shutdown)
 
     # Run MCP server over STDIO
-    mcp.run(transport="stdio")
+    _build_mcp().run(transport="stdio")
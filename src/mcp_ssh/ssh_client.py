@@ -3,19 +3,25 @@
 Uses paramiko for persistent connections and SFTP for file transfers.
 All operations are guarded by the host allowlist from config.
 
-Threading model: Each SSHConnection uses a single RLock that is held during
-all operations (connect, execute, upload, download). This is intentional —
-paramiko's SSHClient is not thread-safe for concurrent operations on the
-same transport. The lock is held for the full duration of each operation
-(not just a single read), so concurrent tool calls targeting the same host
-will queue behind the running operation.
+Threading model: Each SSHConnection keeps a small pool of paramiko clients
+(HostConfig.pool_size, default 4). A short mutex guards only pool
+bookkeeping — checkout, return, and state transitions — and is never held
+during network I/O, so concurrent tool calls targeting the same host run
+in parallel on independent clients. A single paramiko client is never
+shared between two in-flight operations (its transport is not thread-safe
+for that); a semaphore bounds how many clients exist per host, and callers
+beyond that queue until one is returned.
 """
 
 import logging
 import os
-import re
+import select
+import socket
+import stat
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
@@ -33,7 +39,58 @@ logger = logging.getLogger("mcp-ssh")
 # characters have shell significance.
 # Excluded: ! (only in interactive bash), {} (brace expansion, not execution)
 # Includes quotes to prevent subcommand injection (e.g. docker exec ... sh -c '...')
-_SHELL_META_RE = re.compile(r"[;&|`$()<>\n\"']")
+# A frozenset disjointness test beats re.search for these short commands.
+_FORBIDDEN_META = frozenset(";&|`$()<>\n\"'")
+
+# Bytes pulled per Channel.recv call in the output pump. Matched to the
+# transport window below: larger pulls mean fewer Python-level
+# recv/select round-trips per MB of command output.
+_RECV_CHUNK = 262144
+
+# How long after a successful operation checkout may skip the
+# transport-alive probe on idle clients
+_ALIVE_CHECK_TTL_S = 1.0
+
+# Block size for streaming SFTP transfers
+_SFTP_BLOCK = 1 << 20  # 1 MiB
+
+# SSH flow-control window / max packet size negotiated for new transports.
+# Paramiko's defaults keep SFTP throughput RTT-bound on WAN links; larger
+# values let multi-MB transfers keep the pipe full.
+_TRANSPORT_WINDOW_SIZE = 2 ** 22  # 4 MiB
+_TRANSPORT_MAX_PACKET_SIZE = 2 ** 19  # 512 KiB
+
+# Parsed ~/.ssh/known_hosts shared by all connections (see _system_host_keys)
+_host_keys_lock = threading.Lock()
+_cached_system_host_keys: Optional[paramiko.HostKeys] = None
+_cached_host_keys_mtime: Optional[float] = None
+
+
+def _system_host_keys() -> paramiko.HostKeys:
+    """Return the parsed system known_hosts, cached across connects.
+
+    SSHClient.load_system_host_keys re-reads and re-parses the file on
+    every call, which adds disk I/O and key parsing to each reconnect.
+    The parsed HostKeys object is reused until the file's mtime changes;
+    a missing file yields an empty HostKeys, matching paramiko.
+    """
+    global _cached_system_host_keys, _cached_host_keys_mtime
+    path = os.path.expanduser("~/.ssh/known_hosts")
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        mtime = None
+    with _host_keys_lock:
+        if _cached_system_host_keys is None or mtime != _cached_host_keys_mtime:
+            keys = paramiko.HostKeys()
+            if mtime is not None:
+                try:
+                    keys.load(path)
+                except OSError:
+                    pass
+            _cached_system_host_keys = keys
+            _cached_host_keys_mtime = mtime
+        return _cached_system_host_keys
 
 
 class ConnectionState(Enum):
@@ -43,104 +100,273 @@ class ConnectionState(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandResult:
-    """Result of a remote command execution."""
+    """Result of a remote command execution.
+
+    Timing is captured as raw clock readings; the ISO-8601 strings are
+    rendered lazily since most callers only ever read duration_ms.
+    """
     command: str
     exit_code: int
     stdout: str
     stderr: str
     host: str
-    started_at: str
-    ended_at: str
-    duration_ms: int
+    started_ns: int  # time.monotonic_ns() at start
+    ended_ns: int  # time.monotonic_ns() at end
+    started_wall: float  # time.time() at start
+
+    @property
+    def duration_ms(self) -> int:
+        return (self.ended_ns - self.started_ns) // 1_000_000
+
+    @property
+    def started_at(self) -> str:
+        return datetime.fromtimestamp(self.started_wall, timezone.utc).isoformat()
+
+    @property
+    def ended_at(self) -> str:
+        ended_wall = self.started_wall + (self.ended_ns - self.started_ns) / 1e9
+        return datetime.fromtimestamp(ended_wall, timezone.utc).isoformat()
 
 
 class SSHConnection:
-    """Manages a single SSH connection with health monitoring.
+    """Manages a pool of SSH clients for one host, with health monitoring.
 
-    Thread safety: uses a single RLock (reentrant) so that methods like
-    _ensure_connected_locked can call connect() without deadlocking.
-    The lock is held during all blocking I/O to prevent concurrent paramiko
-    operations on the same transport (which is not thread-safe).
+    Thread safety: a short mutex guards only pool bookkeeping (checkout,
+    return, state); it is never held across network I/O. Up to
+    config.pool_size operations can be in flight to this host at once,
+    each on its own paramiko client. The semaphore bounds how many
+    clients exist; callers beyond the bound block until one is returned.
     """
 
     def __init__(self, host_config: HostConfig):
         self.config = host_config
         self.state = ConnectionState.DISCONNECTED
-        self._client: Optional[paramiko.SSHClient] = None
-        self._lock = threading.RLock()  # Reentrant to avoid self-deadlock
+        self._idle: deque[paramiko.SSHClient] = deque()
+        self._borrowed = 0  # clients currently checked out
+        self._lock = threading.Lock()  # guards _idle/_borrowed/state only
+        self._sem = threading.BoundedSemaphore(host_config.pool_size)
         self._last_used: Optional[float] = None
+        self._alive_checked_at = 0.0  # monotonic time of last proven-alive moment
+        # Cached getaddrinfo result; dropped on connect failure so a host
+        # whose address changed gets re-resolved
+        self._addrinfo: Optional[list] = None
+        # Backoff window after a failed connect: while it is open, new
+        # connect attempts fail fast instead of each paying the full
+        # TCP/banner/auth timeouts against a dead host
+        self._dead_until = 0.0  # monotonic deadline
+        self._backoff = 1.0  # seconds; doubles per failure, capped at 30
+        self._last_connect_error: Optional[str] = None
+        # Everything about a connect attempt except the socket is fixed at
+        # construction; the socket is fresh per attempt (see _new_client)
+        self._connect_kwargs_template: dict = {
+            "hostname": host_config.hostname,
+            "port": host_config.port,
+            "username": host_config.username,
+            "timeout": 15,
+            "banner_timeout": 15,
+            "auth_timeout": 15,
+        }
+        if host_config.identity_file:
+            self._connect_kwargs_template["key_filename"] = host_config.identity_file
+            self._connect_kwargs_template["look_for_keys"] = False
+        elif host_config.password:
+            self._connect_kwargs_template["password"] = host_config.password
+            self._connect_kwargs_template["look_for_keys"] = False
 
     def connect(self) -> None:
-        with self._lock:
-            if self.state == ConnectionState.CONNECTED and self._is_alive():
-                return
+        """Ensure at least one live client exists in the pool."""
+        self._checkin(self._checkout(), healthy=True)
 
-            logger.info(f"Connecting to {self.config.name} ({self.config.hostname}:{self.config.port})")
-            self.state = ConnectionState.CONNECTING
+    def disconnect(self) -> None:
+        """Close all pooled clients.
 
-            client = paramiko.SSHClient()
+        Clients borrowed by in-flight operations finish their work and are
+        closed when returned (checkin sees the DISCONNECTED state).
+        """
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+            self.state = ConnectionState.DISCONNECTED
+        for client in idle:
             try:
-                # Host key policy: secure by default
-                if self.config.auto_accept_host_key:
-                    logger.warning(f"Auto-accepting host keys for {self.config.name} (MITM risk)")
-                    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-                else:
-                    client.load_system_host_keys()
-                    client.set_missing_host_key_policy(paramiko.RejectPolicy())
-
-                connect_kwargs = {
-                    "hostname": self.config.hostname,
-                    "port": self.config.port,
-                    "username": self.config.username,
-                    "timeout": 15,
-                    "banner_timeout": 15,
-                    "auth_timeout": 15,
-                }
-
-                if self.config.identity_file:
-                    connect_kwargs["key_filename"] = self.config.identity_file
-                    connect_kwargs["look_for_keys"] = False
-                elif self.config.password:
-                    connect_kwargs["password"] = self.config.password
-                    connect_kwargs["look_for_keys"] = False
-
-                client.connect(**connect_kwargs)
-
-                # Close any previous client to prevent leaks
-                if self._client:
-                    try:
-                        self._client.close()
-                    except Exception:
-                        pass
-
-                self._client = client
-                self.state = ConnectionState.CONNECTED
-                self._last_used = time.monotonic()
-                logger.info(f"Connected to {self.config.name}")
+                client.close()
+            except Exception:
+                pass
+        logger.info(f"Disconnected from {self.config.name}")
+
+    def _open_socket(self) -> socket.socket:
+        """Open the TCP connection for a new client ourselves.
+
+        Doing this here (instead of letting paramiko) lets the DNS
+        resolution be cached across reconnects for the lifetime of this
+        connection object — reconnect churn then pays only the TCP+SSH
+        handshakes, not a resolver round-trip per attempt.
+        """
+        if self._addrinfo is None:
+            self._addrinfo = socket.getaddrinfo(
+                self.config.hostname,
+                self.config.port,
+                socket.AF_UNSPEC,
+                socket.SOCK_STREAM,
+            )
+        last_err: Optional[OSError] = None
+        for family, socktype, proto, _, addr in self._addrinfo:
+            sock = socket.socket(family, socktype, proto)
+            sock.settimeout(15)
+            try:
+                sock.connect(addr)
+            except OSError as e:
+                last_err = e
+                sock.close()
+                continue
+            # Small command round-trips shouldn't wait on Nagle
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            return sock
+        # All cached addresses failed — drop the cache for the next attempt
+        self._addrinfo = None
+        raise last_err if last_err is not None else OSError(
+            f"No addresses resolved for {self.config.hostname}"
+        )
 
-            except Exception as e:
-                # Defensive close — paramiko usually cleans up internally on
-                # connect failure, but explicit close ensures no edge cases.
+    def _new_client(self) -> paramiko.SSHClient:
+        """Create, configure, and connect one fresh client (no pool bookkeeping)."""
+        # Fail fast while the backoff window from the last failure is open,
+        # so a dead host doesn't stall every tool call for the full timeouts
+        # (and reconnection attempts don't hammer a recovering sshd)
+        if time.monotonic() < self._dead_until:
+            raise ConnectionError(
+                f"Connection to {self.config.name} failing, retry later: "
+                f"{self._last_connect_error}"
+            )
+
+        logger.info(f"Connecting to {self.config.name} ({self.config.hostname}:{self.config.port})")
+        self.state = ConnectionState.CONNECTING
+
+        client = paramiko.SSHClient()
+        try:
+            # Host key policy: secure by default
+            if self.config.auto_accept_host_key:
+                logger.warning(f"Auto-accepting host keys for {self.config.name} (MITM risk)")
+                client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            else:
+                # Known hosts are parsed once and shared; update() copies
+                # entries into this client without touching the disk
+                client.get_host_keys().update(_system_host_keys())
+                client.set_missing_host_key_policy(paramiko.RejectPolicy())
+
+            client.connect(sock=self._open_socket(), **self._connect_kwargs_template)
+
+            # Channels opened later (exec sessions, SFTP) inherit these
+            transport = client.get_transport()
+            transport.default_window_size = _TRANSPORT_WINDOW_SIZE
+            transport.default_max_packet_size = _TRANSPORT_MAX_PACKET_SIZE
+            # Keepalives surface dead transports between operations, so a
+            # stale pooled client is replaced instead of timing out mid-call
+            transport.set_keepalive(30)
+
+            self.state = ConnectionState.CONNECTED
+            self._dead_until = 0.0
+            self._backoff = 1.0
+            self._last_connect_error = None
+            logger.info(f"Connected to {self.config.name}")
+            return client
+
+        except Exception as e:
+            # Defensive close — paramiko usually cleans up internally on
+            # connect failure, but explicit close ensures no edge cases.
+            try:
+                client.close()
+            except Exception:
+                pass
+            self.state = ConnectionState.ERROR
+            self._addrinfo = None
+            self._dead_until = time.monotonic() + self._backoff
+            self._backoff = min(30.0, self._backoff * 2)
+            self._last_connect_error = str(e)
+            logger.error(f"Failed to connect to {self.config.name}: {e}")
+            raise
+
+    def _checkout(self) -> paramiko.SSHClient:
+        """Borrow a live client from the pool, creating one if needed.
+
+        Blocks while pool_size clients are already in flight. Dead idle
+        clients found on the way are discarded and replaced.
+        """
+        self._sem.acquire()
+        try:
+            client = None
+            stale = []
+            with self._lock:
+                # A successful operation within the TTL lets a burst of small
+                # commands skip the per-checkout transport probe (which takes
+                # the transport's internal lock). status() does not use this
+                # path, so explicit health checks stay authoritative.
+                recently_ok = (
+                    self.state == ConnectionState.CONNECTED
+                    and time.monotonic() - self._alive_checked_at < _ALIVE_CHECK_TTL_S
+                )
+                while self._idle:
+                    candidate = self._idle.popleft()
+                    if recently_ok or self._client_alive(candidate):
+                        client = candidate
+                        break
+                    stale.append(candidate)
+                if client is not None:
+                    self._borrowed += 1
+            for dead in stale:
                 try:
-                    client.close()
+                    dead.close()
                 except Exception:
                     pass
-                self.state = ConnectionState.ERROR
-                logger.error(f"Failed to connect to {self.config.name}: {e}")
-                raise
-
-    def disconnect(self) -> None:
+            if client is None:
+                client = self._new_client()
+                with self._lock:
+                    self._borrowed += 1
+            return client
+        except BaseException:
+            self._sem.release()
+            raise
+
+    @staticmethod
+    def _get_sftp(client: paramiko.SSHClient) -> paramiko.SFTPClient:
+        """Return the SFTP session cached on a pooled client, opening it on first use.
+
+        Opening an SFTP channel costs a full channel-open round-trip, so
+        each pooled client keeps its session for its lifetime. A borrowed
+        client is used exclusively by one operation, so no locking is
+        needed, and the channel dies with the client on close.
+        """
+        sftp = getattr(client, "_mcp_sftp", None)
+        if sftp is not None:
+            chan = sftp.get_channel()
+            if chan is not None and not chan.closed:
+                return sftp
+        sftp = client.open_sftp()
+        client._mcp_sftp = sftp
+        return sftp
+
+    def _checkin(self, client: paramiko.SSHClient, healthy: bool) -> None:
+        """Return a borrowed client to the pool, or discard it if unhealthy."""
+        close_it = not healthy
         with self._lock:
-            if self._client:
-                try:
-                    self._client.close()
-                except Exception:
-                    pass
-                self._client = None
-            self.state = ConnectionState.DISCONNECTED
-            logger.info(f"Disconnected from {self.config.name}")
+            self._borrowed -= 1
+            if healthy and self.state != ConnectionState.DISCONNECTED:
+                self._idle.append(client)
+                # A successful operation proves the host is reachable even if
+                # a sibling client just errored
+                self.state = ConnectionState.CONNECTED
+                self._last_used = time.monotonic()
+                self._alive_checked_at = self._last_used
+            else:
+                close_it = True
+        if close_it:
+            try:
+                client.close()
+            except Exception:
+                pass
+        self._sem.release()
 
     def execute(self, command: str) -> CommandResult:
         """Execute a command on the remote host.
@@ -152,102 +378,106 @@ class SSHConnection:
         """
         # Check command allowlist — done outside lock (read-only config)
         if self.config.allowed_commands is not None:
-            cmd_base = command.split()[0] if command.strip() else ""
+            # maxsplit=1: only the base word is needed, skip building a full list
+            cmd_base = command.split(None, 1)[0] if command.strip() else ""
             # Reject shell metacharacters that could chain/redirect commands
-            if _SHELL_META_RE.search(command):
+            if not _FORBIDDEN_META.isdisjoint(command):
                 raise PermissionError(
                     f"Command contains shell metacharacters (rejected for host "
                     f"'{self.config.name}' which has an allowlist). "
                     f"Send each command separately without pipes or chaining."
                 )
             if cmd_base not in self.config.allowed_commands:
-                allowed = ", ".join(self.config.allowed_commands)
+                # sorted: frozenset iteration order is arbitrary
+                allowed = ", ".join(sorted(self.config.allowed_commands))
                 raise PermissionError(
                     f"Command '{cmd_base}' not in allowlist for {self.config.name}. "
                     f"Allowed: {allowed}"
                 )
 
-        started_at = datetime.now(timezone.utc)
+        started_wall = time.time()
+        started_ns = time.monotonic_ns()
 
-        with self._lock:
-            self._ensure_connected_locked()
+        client = self._checkout()
+        healthy = True
+        try:
             try:
-                _, stdout, stderr = self._client.exec_command(
-                    command,
-                    timeout=self.config.command_timeout,
-                )
-                # Read stdout and stderr CONCURRENTLY to prevent deadlock.
+                chan = client.get_transport().open_session()
+                # Backstop only — the pump below never blocks in recv, but a
+                # bounded channel timeout means no call can hang indefinitely
+                chan.settimeout(self.config.command_timeout)
+                chan.exec_command(command)
+
+                # Drain stdout and stderr from ONE loop to prevent deadlock.
                 # SSH channels have ~64KB flow-control windows. If a command
-                # fills stderr before closing stdout (or vice versa), sequential
-                # reads deadlock: stdout.read() blocks waiting for EOF, while
-                # the remote process blocks trying to write more stderr.
-                # Sub-threads only touch channel-local objects (no lock needed).
-                # Exceptions are captured and re-raised on the main thread.
-                out_buf: list[bytes] = []
-                err_buf: list[bytes] = []
-                out_exc: list[BaseException] = []
-                err_exc: list[BaseException] = []
-
-                def _read_stdout():
-                    try:
-                        out_buf.append(stdout.read())
-                    except Exception as exc:
-                        out_exc.append(exc)
-
-                def _read_stderr():
-                    try:
-                        err_buf.append(stderr.read())
-                    except Exception as exc:
-                        err_exc.append(exc)
-
-                t_out = threading.Thread(target=_read_stdout, daemon=True)
-                t_err = threading.Thread(target=_read_stderr, daemon=True)
-                t_out.start()
-                t_err.start()
-
-                # Bounded join: if the command produces no output for
-                # command_timeout seconds, the per-recv timeout in the
-                # reader thread will fire and unblock the join.  The
-                # extra buffer here covers the gap between the last
-                # recv timeout and thread teardown.
-                join_deadline = self.config.command_timeout + 5
-                t_out.join(timeout=join_deadline)
-                t_err.join(timeout=join_deadline)
-
-                if t_out.is_alive() or t_err.is_alive():
-                    # Reader threads stuck — kill the channel so they unblock
-                    stdout.channel.close()
-                    raise TimeoutError(
-                        f"Command timed out on '{self.config.name}' "
-                        f"(no output for {self.config.command_timeout}s)"
-                    )
-
-                # Propagate thread exceptions with the real root cause
-                if out_exc:
-                    raise out_exc[0]
-                if err_exc:
-                    raise err_exc[0]
-
-                out = out_buf[0].decode("utf-8", errors="replace")
-                err = err_buf[0].decode("utf-8", errors="replace")
-                exit_code = stdout.channel.recv_exit_status()
-                self._last_used = time.monotonic()
+                # fills stderr before closing stdout (or vice versa), reading
+                # one stream to EOF first deadlocks: the local read blocks
+                # while the remote process blocks writing the other stream.
+                # select() on the channel wakes when either stream (or EOF)
+                # has data, so both are drained as it arrives — no reader
+                # threads needed. The timeout is an inactivity timeout, reset
+                # whenever output arrives, matching the documented semantics.
+                out_ba = bytearray()
+                err_ba = bytearray()
+                timeout = self.config.command_timeout
+                idle_deadline = time.monotonic() + timeout
+                while True:
+                    if chan.recv_ready() or chan.recv_stderr_ready():
+                        while chan.recv_ready():
+                            out_ba += chan.recv(_RECV_CHUNK)
+                        while chan.recv_stderr_ready():
+                            err_ba += chan.recv_stderr(_RECV_CHUNK)
+                        idle_deadline = time.monotonic() + timeout
+                        continue
+                    if chan.exit_status_ready():
+                        break
+                    remaining = idle_deadline - time.monotonic()
+                    if remaining <= 0:
+                        chan.close()
+                        raise TimeoutError(
+                            f"Command timed out on '{self.config.name}' "
+                            f"(no output for {timeout}s)"
+                        )
+                    # select wakes on data or EOF, so the full remaining
+                    # budget can be handed over — no polling interval needed
+                    select.select([chan], [], [], remaining)
+
+                # The transport thread can buffer a final chunk between this
+                # iteration's recv_ready checks and exit_status_ready, so
+                # drain both streams once more before trusting EOF
+                while chan.recv_ready():
+                    out_ba += chan.recv(_RECV_CHUNK)
+                while chan.recv_stderr_ready():
+                    err_ba += chan.recv_stderr(_RECV_CHUNK)
+
+                exit_code = chan.recv_exit_status()
+                # recv_exit_status blocks until the remote close, which can
+                # arrive together with trailing data — collect that too
+                while chan.recv_ready():
+                    out_ba += chan.recv(_RECV_CHUNK)
+                while chan.recv_stderr_ready():
+                    err_ba += chan.recv_stderr(_RECV_CHUNK)
+                chan.close()
+                out = out_ba.decode("utf-8", errors="replace")
+                err = err_ba.decode("utf-8", errors="replace")
             except paramiko.SSHException as e:
+                # Transport died — discard this client; pooled siblings
+                # keep serving.
+                healthy = False
                 self.state = ConnectionState.ERROR
                 logger.error(f"Transport error on {self.config.name}: {e}")
                 raise RuntimeError(
                     f"Command execution failed on '{self.config.name}'"
                 )
             except Exception as e:
-                # Non-transport error (timeout, decode, etc.) — connection
+                # Non-transport error (timeout, decode, etc.) — the client
                 # may still be alive, don't force a reconnect.
                 logger.error(f"Command failed on {self.config.name}: {e}")
                 raise RuntimeError(
                     f"Command execution failed on '{self.config.name}'"
                 )
-
-        ended_at = datetime.now(timezone.utc)
-        duration_ms = int((ended_at - started_at).total_seconds() * 1000)
+        finally:
+            self._checkin(client, healthy)
 
         result = CommandResult(
             command=command,
@@ -255,35 +485,46 @@ class SSHConnection:
             stdout=out,
             stderr=err,
             host=self.config.name,
-            started_at=started_at.isoformat(),
-            ended_at=ended_at.isoformat(),
-            duration_ms=duration_ms,
+            started_ns=started_ns,
+            ended_ns=time.monotonic_ns(),
+            started_wall=started_wall,
         )
 
         logger.info(
-            f"[{self.config.name}] exit={exit_code} duration={duration_ms}ms cmd={command[:80]}"
+            f"[{self.config.name}] exit={exit_code} duration={result.duration_ms}ms cmd={command[:80]}"
         )
         return result
 
     def upload(self, local_path: str, remote_path: str) -> dict:
         """Upload a file via SFTP."""
         local_path = os.path.expanduser(local_path)
-        if not os.path.isfile(local_path):
+        # One stat covers both the is-a-file check and the size
+        try:
+            local_stat = os.stat(local_path)
+        except OSError:
+            raise FileNotFoundError(f"Local file not found: {local_path}")
+        if not stat.S_ISREG(local_stat.st_mode):
             raise FileNotFoundError(f"Local file not found: {local_path}")
 
-        file_size = os.path.getsize(local_path)
+        file_size = local_stat.st_size
 
-        with self._lock:
-            self._ensure_connected_locked()
+        client = self._checkout()
+        healthy = True
+        try:
             try:
-                sftp = self._client.open_sftp()
-                try:
-                    sftp.get_channel().settimeout(self.config.transfer_timeout)
-                    sftp.put(local_path, remote_path)
-                finally:
-                    sftp.close()
-                self._last_used = time.monotonic()
+                sftp = self._get_sftp(client)
+                sftp.get_channel().settimeout(self.config.transfer_timeout)
+                # Stream in large pipelined blocks rather than sftp.put's
+                # 32KB stop-and-wait reads
+                with open(local_path, "rb") as fsrc, sftp.open(remote_path, "wb") as fdst:
+                    fdst.set_pipelined(True)
+                    while True:
+                        block = fsrc.read(_SFTP_BLOCK)
+                        if not block:
+                            break
+                        fdst.write(block)
             except paramiko.SSHException as e:
+                healthy = False
                 self.state = ConnectionState.ERROR
                 logger.error(f"Upload transport error on {self.config.name}: {e}")
                 raise RuntimeError(
@@ -296,6 +537,8 @@ class SSHConnection:
                 raise RuntimeError(
                     f"Upload failed to '{self.config.name}': {remote_path}"
                 )
+        finally:
+            self._checkin(client, healthy)
 
         logger.info(f"[{self.config.name}] uploaded {local_path} -> {remote_path} ({file_size} bytes)")
         return {
@@ -313,16 +556,21 @@ class SSHConnection:
         if local_dir and not os.path.isdir(local_dir):
             os.makedirs(local_dir, exist_ok=True)
 
-        with self._lock:
-            self._ensure_connected_locked()
+        client = self._checkout()
+        healthy = True
+        try:
             try:
-                sftp = self._client.open_sftp()
-                try:
-                    sftp.get_channel().settimeout(self.config.transfer_timeout)
-                    sftp.get(remote_path, local_path)
-                finally:
-                    sftp.close()
-                self._last_used = time.monotonic()
+                sftp = self._get_sftp(client)
+                sftp.get_channel().settimeout(self.config.transfer_timeout)
+                # Prefetch pipelines read-ahead requests; large blocks keep
+                # the Python-side loop count low
+                with sftp.open(remote_path, "rb") as fsrc, open(local_path, "wb") as fdst:
+                    fsrc.prefetch()
+                    while True:
+                        block = fsrc.read(_SFTP_BLOCK)
+                        if not block:
+                            break
+                        fdst.write(block)
             except paramiko.SSHException as e:
                 # Clean up partial download file
                 try:
@@ -331,6 +579,7 @@ class SSHConnection:
                         logger.warning(f"Cleaned up partial download: {local_path}")
                 except OSError:
                     pass
+                healthy = False
                 self.state = ConnectionState.ERROR
                 logger.error(f"Download transport error from {self.config.name}: {e}")
                 raise RuntimeError(
@@ -348,6 +597,8 @@ class SSHConnection:
                 raise RuntimeError(
                     f"Download failed from '{self.config.name}': {remote_path}"
                 )
+        finally:
+            self._checkin(client, healthy)
 
         file_size = os.path.getsize(local_path)
         logger.info(f"[{self.config.name}] downloaded {remote_path} -> {local_path} ({file_size} bytes)")
@@ -380,48 +631,86 @@ class SSHConnection:
             }
 
     def _check_alive_and_sync_state(self) -> bool:
-        """Check if alive and sync state accordingly. Must hold _lock."""
-        alive = self._is_alive()
+        """Check pool liveness and sync state accordingly. Must hold _lock.
+
+        The pool counts as alive if any idle client's transport is active
+        or any client is currently borrowed by an in-flight operation.
+        """
+        alive = self._borrowed > 0 or any(
+            self._client_alive(c) for c in self._idle
+        )
         if self.state == ConnectionState.CONNECTED and not alive:
             self.state = ConnectionState.ERROR
             logger.warning(f"Transport died for {self.config.name}, state -> ERROR")
         return self.state == ConnectionState.CONNECTED and alive
 
-    def _is_alive(self) -> bool:
-        """Check if the underlying SSH transport is active. Must hold _lock."""
-        if not self._client:
+    @staticmethod
+    def _client_alive(client: Optional[paramiko.SSHClient]) -> bool:
+        """Check whether a client's underlying SSH transport is active."""
+        if client is None:
             return False
-        transport = self._client.get_transport()
+        transport = client.get_transport()
         return transport is not None and transport.is_active()
 
-    def _ensure_connected_locked(self) -> None:
-        """Check connection and reconnect if needed. Must be called with _lock held."""
-        if not self._check_alive_and_sync_state():
-            self.connect()
-
 
 class SSHManager:
-    """Manages all SSH connections according to server config."""
+    """Manages all SSH connections according to server config.
+
+    The connection map is read-mostly: every tool call looks up its
+    connection, while inserts happen once per host. Readers therefore
+    take no lock — they grab the current map reference, which writers
+    replace wholesale (copy, mutate, rebind) under a write lock. Binding
+    is atomic in CPython, so a reader always sees a complete dict.
+    """
 
     def __init__(self, config: ServerConfig):
         self.config = config
-        self._connections: dict[str, SSHConnection] = {}
-        self._lock = threading.Lock()
+        self._connections: dict[str, SSHConnection] = {}  # replaced, never mutated
+        self._write_lock = threading.Lock()
 
     def get_connection(self, host_name: str) -> SSHConnection:
         """Get or create a connection for a configured host."""
         host_config = self.config.get_host(host_name)
 
-        with self._lock:
-            if host_name not in self._connections:
-                self._connections[host_name] = SSHConnection(host_config)
-            return self._connections[host_name]
+        conn = self._connections.get(host_name)
+        if conn is not None:
+            return conn
+
+        # Construct outside the write lock so connection setup can never
+        # block get_connection calls for other hosts; the re-check under
+        # the lock keeps exactly one winner if two threads race to create
+        # the same host's connection.
+        conn = SSHConnection(host_config)
+        with self._write_lock:
+            existing = self._connections.get(host_name)
+            if existing is not None:
+                return existing
+            new_map = dict(self._connections)
+            new_map[host_name] = conn
+            self._connections = new_map
+        return conn
 
     def list_hosts(self) -> list[dict]:
         """List all configured hosts with their connection status."""
-        # Snapshot connections under manager lock
-        with self._lock:
-            conn_snapshot = dict(self._connections)
+        # The map reference is immutable once published — no lock needed
+        conn_snapshot = self._connections
+
+        # status() holds each conn's lock for both reads (avoiding a race
+        # between state and connected values) and can probe the transport,
+        # so for more than a handful of hosts fan out instead of walking
+        # them sequentially. Hosts are independent.
+        statuses: dict[str, dict] = {}
+        if len(conn_snapshot) > 4:
+            with ThreadPoolExecutor(max_workers=min(32, len(conn_snapshot))) as pool:
+                futures = {
+                    pool.submit(conn.status): name
+                    for name, conn in conn_snapshot.items()
+                }
+                for fut in as_completed(futures):
+                    statuses[futures[fut]] = fut.result()
+        else:
+            for name, conn in conn_snapshot.items():
+                statuses[name] = conn.status()
 
         hosts = []
         for name, host_config in self.config.hosts.items():
@@ -433,33 +722,39 @@ class SSHManager:
                 "has_key": host_config.identity_file is not None,
                 "command_timeout": host_config.command_timeout,
             }
-            conn = conn_snapshot.get(name)
-            if conn:
-                # Use status() which holds conn._lock for both reads,
-                # avoiding a race between state and connected values
-                st = conn.status()
+            st = statuses.get(name)
+            if st is not None:
                 info.update({"state": st["state"], "connected": st["connected"]})
             else:
                 info.update({"state": "disconnected", "connected": False})
 
             if host_config.allowed_commands:
-                info["allowed_commands"] = host_config.allowed_commands
+                info["allowed_commands"] = sorted(host_config.allowed_commands)
 
             hosts.append(info)
         return hosts
 
     def disconnect_all(self) -> None:
         """Disconnect all active connections."""
-        # Snapshot and clear under manager lock, then disconnect outside it
-        # to avoid holding both manager lock and connection lock simultaneously
-        with self._lock:
+        # Swap in an empty map, then disconnect outside the write lock to
+        # avoid holding both it and a connection lock simultaneously
+        with self._write_lock:
             connections = list(self._connections.values())
-            self._connections.clear()
+            self._connections = {}
 
-        for conn in connections:
+        def _safe_disconnect(conn: SSHConnection) -> None:
             try:
                 conn.disconnect()
             except Exception as e:
                 logger.error(f"Error disconnecting {conn.config.name}: {e}")
 
+        # Hosts are independent, and each disconnect can block on a close
+        # round-trip — fan out so shutdown latency doesn't scale with the
+        # number of connected hosts
+        if len(connections) > 1:
+            with ThreadPoolExecutor(max_workers=min(16, len(connections))) as pool:
+                list(pool.map(_safe_disconnect, connections))
+        elif connections:
+            _safe_disconnect(connections[0])
+
         logger.info("All connections closed")